@@ -18,7 +18,7 @@ setup(
     package_dir={"": "src"},
     package_data={"": ["*.pdf"]},
     install_requires=[
-        "numpy", "scipy", "matplotlib", "scikit-learn", 'fire',
+        "numpy", "scipy", "matplotlib", "scikit-learn", "joblib", 'fire',
         "beartype==0.9.1",
     ],
     classifiers=[
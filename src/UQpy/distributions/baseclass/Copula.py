@@ -11,6 +11,10 @@ class Copula(ABC):
         Define a copula for a multivariate distribution whose dependence structure is defined with a copula.
         This class is used in support of the :class:`.JointCopula` class.
 
+        Child classes may implement the :meth:`evaluate_cdf`, :meth:`evaluate_pdf` and :meth:`evaluate_log_pdf` methods,
+        which define the corresponding methods of the :class:`.JointCopula`. If :meth:`evaluate_log_pdf` is available,
+        it is preferred to the logarithm of :meth:`evaluate_pdf` when computing :meth:`.JointCopula.log_pdf`.
+
         :param ordered_parameters: List of parameter names
         :param kwargs: Parameters of the copula.
         """
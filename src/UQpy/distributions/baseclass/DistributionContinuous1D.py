@@ -6,12 +6,18 @@ from abc import ABC
 class DistributionContinuous1D(Distribution1D, ABC):
     """
     Parent class for univariate continuous probability distributions.
+
+    Child classes may implement a :meth:`log_pdf_and_cdf` method returning both the log-pdf and the cdf at the same
+    points, when these share intermediate computations. It is used by :class:`.JointCopula` if available for all
+    marginals. To evaluate it in a single call for marginals of the same family, the class must also define a static
+    :code:`_log_pdf_and_cdf(x, **parameters)` that broadcasts the parameters over :code:`x` (see :class:`.Normal`).
     """
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
     def _construct_from_scipy(self, scipy_name=stats.rv_continuous):
+        self._scipy_name = scipy_name
         self.pdf = lambda x: scipy_name.pdf(x=self.check_x_dimension(x), **self.parameters)
         self.log_pdf = lambda x: scipy_name.logpdf(x=self.check_x_dimension(x), **self.parameters)
         self._retrieve_1d_data_from_scipy(scipy_name)
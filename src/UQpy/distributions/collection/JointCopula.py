@@ -1,4 +1,4 @@
-from types import MethodType
+import weakref
 from typing import Union
 
 import numpy as np
@@ -11,6 +11,69 @@ from UQpy.distributions.baseclass import (
     DistributionDiscrete1D,
 )
 
+_CACHE_MAX_BYTES = 2 ** 20
+
+
+def _same_parameters(parameters1, parameters2):
+    # Parameter values may be arrays, for which == is elementwise
+    if parameters1 is None or parameters2 is None or len(parameters1) != len(parameters2):
+        return parameters1 is parameters2
+    return all(value1 is value2 or (_same_parameters(value1, value2) if isinstance(value1, tuple)
+                                    else np.array_equal(value1, value2))
+               for value1, value2 in zip(parameters1, parameters2))
+
+
+def _joint_cdf(dist, x):
+    x = dist._check_x_dimension_cached(x)
+    # Compute cdf of independent marginals
+    unif = dist._evaluate_marginals(x, "cdf")
+    # Compute copula
+    cdf_val = dist._evaluate_copula("evaluate_cdf", unif)
+    return cdf_val.copy()
+
+
+def _marginals_log_pdf_and_cdf(dist, x):
+    # Marginals implementing log_pdf_and_cdf share the intermediate computations between both quantities
+    if dist._combined_log_pdf_and_cdf:
+        return dist._evaluate_marginals(x, "log_pdf_and_cdf")
+    return dist._evaluate_marginals(x, "log_pdf"), dist._evaluate_marginals(x, "cdf")
+
+
+def _joint_pdf(dist, x):
+    x = dist._check_x_dimension_cached(x)
+    # Compute pdf of independent marginals, in log domain when possible to avoid underflow of the product
+    if dist._pdf_from_log_pdf:
+        logpdf_marginals, unif = _marginals_log_pdf_and_cdf(dist, x)
+        pdf_val = np.exp(logpdf_marginals.sum(axis=1))
+    else:
+        pdf_val = dist._evaluate_marginals(x, "pdf").prod(axis=1)
+        unif = dist._evaluate_marginals(x, "cdf")
+    # Add copula term
+    c_ = dist._evaluate_copula("evaluate_pdf", unif)
+    return c_ * pdf_val
+
+
+def _joint_log_pdf(dist, x):
+    x = dist._check_x_dimension_cached(x)
+    # Compute pdf of independent marginals
+    logpdf_marginals, unif = _marginals_log_pdf_and_cdf(dist, x)
+    logpdf_val = logpdf_marginals.sum(axis=1)
+    # Add copula term
+    c_ = dist._evaluate_copula("evaluate_pdf", unif)
+    return np.log(c_) + logpdf_val
+
+
+def _joint_log_pdf_from_log_copula(dist, x):
+    x = dist._check_x_dimension_cached(x)
+    # Compute pdf of independent marginals
+    logpdf_marginals, unif = _marginals_log_pdf_and_cdf(dist, x)
+    logpdf_val = logpdf_marginals.sum(axis=1)
+    # Add copula term, directly in log domain
+    return dist._evaluate_copula("evaluate_log_pdf", unif) + logpdf_val
+
+
+_BOUND_METHODS = (_joint_cdf, _joint_pdf, _joint_log_pdf, _joint_log_pdf_from_log_copula)
+
 
 class JointCopula(DistributionND):
     @beartype
@@ -57,70 +120,143 @@ class JointCopula(DistributionND):
             )
         Copula.check_marginals(marginals=self.marginals)
 
-        # Check if methods should exist, if yes define them bound them to the object
-        if hasattr(self.copula, "evaluate_cdf"):
+        # Marginals that share the same scipy.stats family are evaluated with a single broadcasted call
+        scipy_names = set(getattr(m, "_scipy_name", None) for m in self.marginals)
+        self._scipy_name = scipy_names.pop() if len(scipy_names) == 1 else None
+        if self._scipy_name is not None:
+            # Structure of arrays: one row of shape (dimension, ) per parameter name, refreshed in place
+            self._soa_values = np.empty((len(self.marginals[0].parameters), len(self.marginals)))
+            self._soa = dict(zip(self.marginals[0].parameters, self._soa_values))
+            self._soa_parameters = None
 
-            def joint_cdf(dist, x):
-                x = dist.check_x_dimension(x)
-                # Compute cdf of independent marginals
-                unif = np.array(
-                    [marg.cdf(x[:, ind_m]) for ind_m, marg in enumerate(dist.marginals)]
-                ).T
-                # Compute copula
-                cdf_val = dist.copula.evaluate_cdf(unit_uniform_samples=unif)
-                return cdf_val
+        # Marginal evaluations are cached so that repeated calls at the same points and parameters (e.g., pdf and
+        # log_pdf within an optimization loop) do not recompute them. Set to False to skip hashing of the inputs.
+        self._cache = True
+        self._marginals_cache = {}
+        self._checked_x = lambda: None
+        self._copula_cache = {}
+        self._combined_log_pdf_and_cdf = all(hasattr(m, "log_pdf_and_cdf") for m in self.marginals)
 
-            self.cdf = MethodType(joint_cdf, self)
+        # Check if methods should exist, if yes bind the module-level implementations to the object
+        if hasattr(self.copula, "evaluate_cdf"):
+            self.cdf = _joint_cdf.__get__(self)
 
         if all(hasattr(m, "pdf") for m in self.marginals) and hasattr(
             self.copula, "evaluate_pdf"
         ):
+            self._pdf_from_log_pdf = all(hasattr(m, "log_pdf") for m in self.marginals)
+            self.pdf = _joint_pdf.__get__(self)
 
-            def joint_pdf(dist, x):
-                x = dist.check_x_dimension(x)
-                # Compute pdf of independent marginals
-                pdf_val = np.prod(
-                    np.array(
-                        [
-                            marg.pdf(x[:, ind_m])
-                            for ind_m, marg in enumerate(dist.marginals)
-                        ]
-                    ),
-                    axis=0,
-                )
-                # Add copula term
-                unif = np.array(
-                    [marg.cdf(x[:, ind_m]) for ind_m, marg in enumerate(dist.marginals)]
-                ).T
-                c_ = dist.copula.evaluate_pdf(unit_uniform_samples=unif)
-                return c_ * pdf_val
-
-            self.pdf = MethodType(joint_pdf, self)
-
-        if all(hasattr(m, "log_pdf") for m in self.marginals) and hasattr(
-            self.copula, "evaluate_pdf"
-        ):
+        if all(hasattr(m, "log_pdf") for m in self.marginals):
+            if hasattr(self.copula, "evaluate_log_pdf"):
+                self.log_pdf = _joint_log_pdf_from_log_copula.__get__(self)
+            elif hasattr(self.copula, "evaluate_pdf"):
+                self.log_pdf = _joint_log_pdf.__get__(self)
+
+    def __getstate__(self):
+        # The caches are not pickled, and the methods bound to the object are pickled by the name of the module-level
+        # implementation, since they cannot be retrieved as attributes of the class
+        state = self.__dict__.copy()
+        state.update(_checked_x=None, _marginals_cache={}, _copula_cache={})
+        if self._scipy_name is not None:
+            # The rows of _soa are views into _soa_values, rebuilt after unpickling so that they stay shared
+            del state["_soa"]
+            state["_soa_parameters"] = None
+        for method in ("cdf", "pdf", "log_pdf"):
+            if getattr(state.get(method), "__func__", None) in _BOUND_METHODS:
+                state[method] = state[method].__func__.__name__
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._checked_x = lambda: None
+        if self._scipy_name is not None:
+            self._soa = dict(zip(self.marginals[0].parameters, self._soa_values))
+        for method in ("cdf", "pdf", "log_pdf"):
+            if isinstance(state.get(method), str):
+                setattr(self, method, globals()[state[method]].__get__(self))
+
+    def _check_x_dimension_cached(self, x):
+        """
+        Same as :meth:`check_x_dimension`, but the check is skipped when called again with the same
+        :class:`numpy.ndarray` (e.g., the data inside an optimization loop), which is then returned without copy.
+        """
+        if self._checked_x() is x and x.ndim == 2:
+            return x
+        checked_x = self.check_x_dimension(x)
+        if not isinstance(x, np.ndarray):
+            return checked_x
+        self._checked_x = weakref.ref(x)
+        return x
+
+    def _evaluate_marginals(self, x: np.ndarray, method: str) -> np.ndarray:
+        """
+        Evaluate the `method` (:code:`cdf`, :code:`pdf`, :code:`log_pdf` or :code:`log_pdf_and_cdf`) of all marginals at
+        points `x`.
+
+        The last result of each method is cached on the content of `x` and the current marginal parameters, unless
+        :code:`_cache` is set to :any:`False` or `x` is larger than :code:`_CACHE_MAX_BYTES`. The returned array must
+        not be modified in place.
 
-            def joint_log_pdf(dist, x):
-                x = dist.check_x_dimension(x)
-                # Compute pdf of independent marginals
-                logpdf_val = np.sum(
-                    np.array(
-                        [
-                            marg.log_pdf(x[:, ind_m])
-                            for ind_m, marg in enumerate(dist.marginals)
-                        ]
-                    ),
-                    axis=0,
-                )
-                # Add copula term
-                unif = np.array(
-                    [marg.cdf(x[:, ind_m]) for ind_m, marg in enumerate(dist.marginals)]
-                ).T
-                c_ = dist.copula.evaluate_pdf(unit_uniform_samples=unif)
-                return np.log(c_) + logpdf_val
-
-            self.log_pdf = MethodType(joint_log_pdf, self)
+        :param x: Points at which to evaluate the marginals, of shape :code:`(npoints, dimension)`.
+        :param method: Name of the marginal method to evaluate.
+        :return: Values of the marginal method, of shape :code:`(npoints, dimension)`.
+        """
+        parameters = tuple(tuple(m.parameters.values()) for m in self.marginals)
+        if not self._cache or x.nbytes > _CACHE_MAX_BYTES:
+            return self._compute_marginals(x, method, parameters)
+        key = (x.shape, x.dtype.str, x.tobytes())
+        cached = self._marginals_cache.get(method)
+        if cached is not None and cached[0] == key and _same_parameters(cached[1], parameters):
+            return cached[2]
+        values = self._compute_marginals(x, method, parameters)
+        for value in (values if isinstance(values, tuple) else (values, )):
+            value.flags.writeable = False
+        self._marginals_cache[method] = (key, parameters, values)
+        return values
+
+    def _evaluate_copula(self, method: str, unif: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the copula `method` (:code:`evaluate_cdf`, :code:`evaluate_pdf` or :code:`evaluate_log_pdf`) at
+        `unif`.
+
+        The last result of each method is kept and returned again if the copula parameters are unchanged and `unif` is
+        the same read-only array, i.e., the cached marginal cdf values returned by :meth:`_evaluate_marginals`.
+        """
+        parameters = tuple(self.copula.parameters.values())
+        cached = self._copula_cache.get(method)
+        if cached is not None and cached[1] is unif and _same_parameters(cached[0], parameters):
+            return cached[2]
+        values = getattr(self.copula, method)(unit_uniform_samples=unif)
+        if not unif.flags.writeable:
+            values = np.asarray(values)
+            values.flags.writeable = False
+            self._copula_cache[method] = (parameters, unif, values)
+        return values
+
+    def _compute_marginals(self, x: np.ndarray, method: str, parameters: tuple) -> np.ndarray:
+        """
+        If all marginals belong to the same :py:mod:`scipy.stats` family and all their parameters are set, the method
+        is evaluated with a single call broadcasted over `x`, using the parameters stored as arrays of shape
+        :code:`(dimension, )`. For :code:`log_pdf_and_cdf`, this requires the marginal class to define a static
+        :code:`_log_pdf_and_cdf(x, **parameters)`. Otherwise, each marginal is evaluated in turn. For
+        :code:`log_pdf_and_cdf`, a tuple of two arrays is returned.
+        """
+        # Unset (None) parameters are left to the marginals, rather than being stored as nan in the structure of arrays
+        if (self._scipy_name is not None
+                and (method != "log_pdf_and_cdf" or hasattr(type(self.marginals[0]), "_log_pdf_and_cdf"))
+                and not any(value is None for values in parameters for value in values)):
+            # Refresh the structure of arrays if the marginal parameters changed since the last evaluation
+            if not _same_parameters(parameters, self._soa_parameters):
+                self._soa_values[:] = np.array(parameters, dtype=float).T
+                self._soa_parameters = parameters
+            if method == "log_pdf_and_cdf":
+                return type(self.marginals[0])._log_pdf_and_cdf(x, **self._soa)
+            return getattr(self._scipy_name, method.replace("_", ""))(x, **self._soa)
+        values = [getattr(marg, method)(x[:, ind_m]) for ind_m, marg in enumerate(self.marginals)]
+        if method == "log_pdf_and_cdf":
+            return tuple(np.stack(value, axis=1) for value in zip(*values))
+        return np.stack(values, axis=1)
 
     def get_parameters(self) -> dict:
         """
@@ -1,6 +1,10 @@
 from typing import Union
+
+import numpy as np
 import scipy.stats as stats
 from beartype import beartype
+from scipy.special import ndtr
+
 from UQpy.distributions.baseclass import DistributionContinuous1D
 
 
@@ -17,3 +21,17 @@ class Normal(DistributionContinuous1D):
         """
         super().__init__(loc=loc, scale=scale, ordered_parameters=("loc", "scale"))
         self._construct_from_scipy(scipy_name=stats.norm)
+
+    def log_pdf_and_cdf(self, x):
+        """
+        Evaluate both the log-pdf and the cdf at points `x`, sharing the standardization :math:`(x-loc)/scale`.
+
+        :param x: Points at which to evaluate the log-pdf and cdf.
+        :return: Tuple of the log-pdf and cdf values.
+        """
+        return self._log_pdf_and_cdf(self.check_x_dimension(x), **self.parameters)
+
+    @staticmethod
+    def _log_pdf_and_cdf(x, loc, scale):
+        z = (x - loc) / scale
+        return -0.5 * z ** 2 - np.log(np.sqrt(2 * np.pi) * scale), ndtr(z)
@@ -7,6 +7,7 @@ from beartype import beartype
 from UQpy.utilities.ValidationTypes import Numpy2DFloatArray
 from UQpy.distributions.baseclass import Copula
 from numpy import log, exp
+from scipy.special import xlogy
 
 
 class Gumbel(Copula):
@@ -68,6 +69,29 @@ class Gumbel(Copula):
                    * (1 + (theta - 1) * ((-log(u)) ** theta + (-log(v)) ** theta) ** (-1 / theta)))
         return pdf_val
 
+    def evaluate_log_pdf(self, unit_uniform_samples: Numpy2DFloatArray) -> numpy.ndarray:
+        """
+        Compute the logarithm of the copula pdf :math:`\log c(u_1, u_2, ..., u_d)`.
+
+        The computation is performed in log domain, which avoids underflow of the copula pdf. This method is used by
+        the :meth:`.JointCopula.log_pdf` method.
+
+        :param unit_uniform_samples: Points (uniformly distributed) at which to evaluate the copula log-pdf, must be of
+         shape :code:`(npoints, dimension)`.
+
+        :return: Values of the log of the copula pdf term.
+        """
+        theta, u, v = self.extract_data(unit_uniform_samples)
+        log_u, log_v = log(u), log(v)
+        sum_ = (-log_u) ** theta + (-log_v) ** theta
+
+        # xlogy gives 0 instead of nan for the zero-weighted terms at theta = 1 when a cdf value rounds to 1
+        log_pdf_val = (-sum_ ** (1 / theta) - log_u - log_v
+                       + xlogy(-2 + 2 / theta, sum_)
+                       + xlogy(theta - 1, log_u * log_v)
+                       + log(1 + ((theta - 1) * sum_ ** (-1 / theta) if theta != 1 else 0.)))
+        return log_pdf_val
+
     def extract_data(self, unit_uniform_samples):
         u = unit_uniform_samples[:, 0]
         v = unit_uniform_samples[:, 1]
@@ -2,12 +2,14 @@ import logging
 from typing import Union
 
 import numpy as np
+from joblib import Parallel, delayed
 from UQpy.utilities.MinimizeOptimizer import MinimizeOptimizer
 from beartype import beartype
 
 from UQpy.inference.inference_models.baseclass.InferenceModel import InferenceModel
+from UQpy.inference.inference_models.DistributionModel import DistributionModel
 from UQpy.utilities.Utilities import process_random_state
-from UQpy.utilities.ValidationTypes import NumpyFloatArray, RandomStateType
+from UQpy.utilities.ValidationTypes import NumpyFloatArray, RandomStateType, PositiveInteger
 
 
 class MLE:
@@ -22,6 +24,7 @@ class MLE:
             initial_parameters: Union[list, np.ndarray, None] = None,
             optimizer=MinimizeOptimizer(),
             random_state: RandomStateType = None,
+            n_jobs: PositiveInteger = 1,
     ):
         """
         Estimate the maximum likelihood parameters of a model given some data.
@@ -41,8 +44,13 @@ class MLE:
          initial guess(es). The identified MLE is the one that yields the maximum log likelihood over all calls of the
          optimizer.
         :param optimizer: This parameter takes as input an object that implements the :class:`Optimizer` class.
-         Default is the :class:`.Minimize` which utilizes the :class:`scipy.optimize.minimize` method.
+         Default is the :class:`.Minimize` which utilizes the :class:`scipy.optimize.minimize` method. If the optimizer
+         possesses an :meth:`optimize_batch` method (e.g., the ``BatchNelderMeadOptimizer`` of the
+         :py:mod:`UQpy.utilities.BatchNelderMeadOptimizer` module), all starts are run together and the log-likelihood
+         is evaluated for all of them in a single call.
         :param random_state: Random seed used to initialize the pseudo-random number generator. Default is :any:`None`.
+        :param n_jobs: Number of processes used to run the optimizations from the different starting points in
+         parallel, using the :code:`loky` backend of :py:mod:`joblib`. Default is :math:`1` (serial execution).
         """
         # Initialize variables
         self.inference_model = inference_model
@@ -50,6 +58,8 @@ class MLE:
         self.random_state = process_random_state(random_state)
         self.logger = logging.getLogger(__name__)
         self.optimizer = optimizer
+        self.n_jobs = n_jobs
+        self._param_buf = None
         self.mle: NumpyFloatArray = None
         """Value of parameter vector that maximizes the likelihood function."""
         self.max_log_like: NumpyFloatArray = None
@@ -101,35 +111,50 @@ class MLE:
             self._run_optimization(self.initial_parameters, self.n_optimizations)
 
     def _run_distribution_fit(self, n_optimizations):
-        for _ in range(n_optimizations):
+        mle_candidates = np.empty((n_optimizations, len(self.inference_model.list_params)))
+        for i in range(n_optimizations):
             self.inference_model.distributions.update_parameters(
                 **{key: None for key in self.inference_model.list_params})
             mle_dict = self.inference_model.distributions.fit(data=self.data)
-            mle_tmp = np.array([mle_dict[key] for key in self.inference_model.list_params])
-            max_log_like_tmp = self.inference_model.evaluate_log_likelihood(
-                parameters=mle_tmp[np.newaxis, :], data=self.data)[0]
-            # Save result
-            if self.mle is None or max_log_like_tmp > self.max_log_like:
-                self.mle = mle_tmp
-                self.max_log_like = max_log_like_tmp
+            mle_candidates[i] = [mle_dict[key] for key in self.inference_model.list_params]
+        # Evaluate the likelihood of all candidates at once
+        log_like_candidates = self.inference_model.evaluate_log_likelihood(parameters=mle_candidates, data=self.data)
+        # Candidates with a nan likelihood are only kept if no other candidate is available
+        best = 0 if np.all(np.isnan(log_like_candidates)) else np.nanargmax(log_like_candidates)
+        # Save result
+        if self.mle is None or log_like_candidates[best] > self.max_log_like:
+            self.mle = mle_candidates[best]
+            self.max_log_like = log_like_candidates[best]
 
     def _run_optimization(self, initial_parameters, n_optimizations):
         if initial_parameters is None:
-            from UQpy.distributions import Uniform
-            initial_parameters = (
-                Uniform()
-                    .rvs(nsamples=n_optimizations * self.inference_model.n_parameters, random_state=self.random_state, )
-                    .reshape((n_optimizations, self.inference_model.n_parameters)))
+            initial_parameters = self.random_state.random((n_optimizations, self.inference_model.n_parameters))
             if self.optimizer._bounds is not None:
                 bounds = np.array(self.optimizer._bounds)
-                initial_parameters = (bounds[:, 0].reshape((1, -1))
-                                      + (bounds[:, 1] - bounds[:, 0]).reshape((1, -1)) * initial_parameters)
+                initial_parameters = bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * initial_parameters
         else:
             initial_parameters = np.atleast_2d(initial_parameters)
             if initial_parameters.shape[1] != self.inference_model.n_parameters:
                 raise ValueError("UQpy: Wrong dimensions in x0")
-        for x0_ in initial_parameters:
-            res = self.optimizer.optimize(self._evaluate_func_to_minimize, x0_)
+        # Parameter buffer reused across the evaluations of the function to minimize. It is only used with a
+        # DistributionModel, which copies the parameter values into the distribution: other models (e.g., RunModel
+        # samples of a ComputationalModel, or a user-defined log-likelihood) may keep a reference to the parameters.
+        self._param_buf = (np.empty((1, self.inference_model.n_parameters))
+                           if isinstance(self.inference_model, DistributionModel) else None)
+        if getattr(self.inference_model, "scalar_log_likelihood", None) is not None:
+            function_to_minimize = self._evaluate_scalar_func_to_minimize
+        else:
+            function_to_minimize = self._evaluate_func_to_minimize
+        if hasattr(self.optimizer, "optimize_batch"):
+            # All starts are advanced together, the likelihood is evaluated once per iteration for all of them
+            results = self.optimizer.optimize_batch(self._evaluate_batch_func_to_minimize, initial_parameters)
+        elif self.n_jobs > 1 and len(initial_parameters) > 1:
+            # Starts are independent, run them in separate processes (loky backend, serialized with cloudpickle)
+            results = Parallel(n_jobs=min(self.n_jobs, len(initial_parameters)), backend="loky")(
+                delayed(self.optimizer.optimize)(function_to_minimize, x0_) for x0_ in initial_parameters)
+        else:
+            results = [self.optimizer.optimize(function_to_minimize, x0_) for x0_ in initial_parameters]
+        for res in results:
             mle_tmp = res.x
             max_log_like_tmp = (-1.0) * res.fun
             # Save result
@@ -138,7 +163,16 @@ class MLE:
                 self.max_log_like = max_log_like_tmp
         self.logger.info("UQpy: ML estimation completed.")
 
-    @beartype
     def _evaluate_func_to_minimize(self, one_param: np.ndarray):
-        return (-1 * self.inference_model.evaluate_log_likelihood(
-            parameters=one_param.reshape((1, -1)), data=self.data)[0])
+        if self._param_buf is None:
+            parameters = one_param.reshape((1, -1))
+        else:
+            self._param_buf[0, :] = one_param
+            parameters = self._param_buf
+        return -1 * self.inference_model.evaluate_log_likelihood(parameters=parameters, data=self.data)[0]
+
+    def _evaluate_scalar_func_to_minimize(self, one_param: np.ndarray):
+        return -1 * self.inference_model.scalar_log_likelihood(one_param, self.data)
+
+    def _evaluate_batch_func_to_minimize(self, parameters: np.ndarray):
+        return -1 * self.inference_model.evaluate_log_likelihood(parameters=parameters, data=self.data)
@@ -11,18 +11,24 @@ from UQpy.inference.inference_models.baseclass.InferenceModel import *
 
 class LogLikelihoodModel(InferenceModel):
     @beartype
-    def __init__(self, n_parameters: PositiveInteger, log_likelihood: Callable, name: str = ""):
+    def __init__(self, n_parameters: PositiveInteger, log_likelihood: Callable, name: str = "",
+                 scalar_log_likelihood: Callable = None):
         """
         Define a log-likelihood model for inference.
 
         :param n_parameters: Number of parameters to be estimated.
         :param log_likelihood: Function that defines the log-likelihood model.
         :param name: Name of model - optional but useful in a model selection setting.
+        :param scalar_log_likelihood: Optional function :code:`scalar_log_likelihood(params, data)` that returns the
+         log-likelihood as a float for a single parameter vector of shape :code:`(n_parameters, )`. If provided, it is
+         called directly by the optimizer in :class:`.MLE`, which avoids reshaping and validating the parameters at each
+         iteration. It may be a compiled function, e.g. decorated with :code:`numba.njit`.
         """
         super().__init__(n_parameters, name)
         self.name = name
         self.log_likelihood = log_likelihood
         self.n_parameters = n_parameters
+        self.scalar_log_likelihood = scalar_log_likelihood
 
     def evaluate_log_likelihood(self, parameters: np.ndarray, data: np.ndarray):
         log_like_values = self.log_likelihood(data=data, params=parameters)
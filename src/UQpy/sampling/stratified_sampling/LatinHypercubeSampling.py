@@ -60,7 +60,7 @@ class LatinHypercubeSampling(StratifiedSampling):
         elif isinstance(self.distributions, JointIndependent):
             self._samples = np.zeros([self.nsamples, len(self.distributions.marginals)])
 
-        self.samplesU01: NumpyFloatArray = np.zeros_like(self._samples)
+        self.samplesU01: NumpyFloatArray = None
         """The generated LHS samples on the unit hypercube."""
 
         if self.nsamples is not None:
@@ -96,17 +96,38 @@ class LatinHypercubeSampling(StratifiedSampling):
         self.samplesU01 = u_lhs
 
         if isinstance(self.distributions, list):
-            for j in range(len(self.distributions)):
-                if hasattr(self.distributions[j], "icdf"):
-                    self._samples[:, j] = self.distributions[j].icdf(u_lhs[:, j])
+            self._icdf_batch(u_lhs, self.distributions)
 
         elif isinstance(self.distributions, JointIndependent):
             if all(hasattr(m, "icdf") for m in self.distributions.marginals):
-                for j in range(len(self.distributions.marginals)):
-                    self._samples[:, j] = self.distributions.marginals[j].icdf(u_lhs[:, j])
+                self._icdf_batch(u_lhs, self.distributions.marginals)
 
         elif isinstance(self.distributions, DistributionContinuous1D):
             if hasattr(self.distributions, "icdf"):
                 self._samples = self.distributions.icdf(u_lhs)
 
         self.logger.info("Successful execution of LHS design.")
+
+    def _icdf_batch(self, u_lhs, marginals):
+        """
+        Map the samples on the unit hypercube to the marginals via their icdf, writing into :py:attr:`samples`.
+
+        Marginals are grouped by :py:mod:`scipy.stats` family. Within each group, the parameters are stacked into
+        arrays of shape :code:`(group_size, )` and the icdf of all the columns of the group is evaluated with a single
+        broadcasted call. Marginals that are not constructed from :py:mod:`scipy.stats` are mapped one at a time.
+        """
+        columns_per_family = {}
+        for j, marginal in enumerate(marginals):
+            scipy_name = getattr(marginal, "_scipy_name", None)
+            if scipy_name is not None:
+                columns_per_family.setdefault(scipy_name, []).append(j)
+            elif hasattr(marginal, "icdf"):
+                self._samples[:, j] = marginal.icdf(u_lhs[:, j])
+
+        for scipy_name, columns in columns_per_family.items():
+            group = [marginals[j] for j in columns]
+            parameters = {key: np.array([m.parameters[key] for m in group]) for key in group[0].parameters}
+            if len(columns) == len(marginals):
+                self._samples[:, :] = scipy_name.ppf(u_lhs, **parameters)
+            else:
+                self._samples[:, columns] = scipy_name.ppf(u_lhs[:, columns], **parameters)
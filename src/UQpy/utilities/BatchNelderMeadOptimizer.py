@@ -0,0 +1,131 @@
+import logging
+
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+
+class BatchNelderMeadOptimizer:
+
+    def __init__(self, bounds=None, max_iterations: int = 10000, x_tolerance: float = 1e-4,
+                 f_tolerance: float = 1e-4):
+        """
+        Nelder-Mead simplex algorithm run in lockstep from several initial guesses.
+
+        At every iteration, the candidate points of all the simplices are gathered in a single array of shape
+        :code:`(nstarts, n_parameters)` and passed at once to the function to minimize, so that functions that are
+        vectorized over their first axis (e.g., :meth:`.InferenceModel.evaluate_log_likelihood`) are called once per
+        iteration rather than once per start.
+
+        :param bounds: Sequence of :code:`(min, max)` pairs for each parameter. Candidate points are clipped to the
+         bounds. Default is :any:`None` (unbounded).
+        :param max_iterations: Maximum number of iterations for each start.
+        :param x_tolerance: Absolute tolerance on the simplex vertices used as convergence criterion.
+        :param f_tolerance: Absolute tolerance on the function values used as convergence criterion.
+        """
+        self._bounds = bounds
+        self.logger = logging.getLogger(__name__)
+        self.method = 'nelder-mead'
+        self.max_iterations = max_iterations
+        self.x_tolerance = x_tolerance
+        self.f_tolerance = f_tolerance
+        self.constraints = {}
+
+    def optimize(self, function, initial_guess, args=(), jac=False):
+        def batch_function(points):
+            return np.array([function(point, *args) for point in points])
+
+        return self.optimize_batch(batch_function, np.atleast_2d(initial_guess))[0]
+
+    def optimize_batch(self, function, initial_guesses):
+        """
+        Minimize `function` starting from each row of `initial_guesses`.
+
+        :param function: Function to minimize, takes as input an :class:`numpy.ndarray` of shape
+         :code:`(npoints, n_parameters)` and returns an :class:`numpy.ndarray` of shape :code:`(npoints, )`.
+        :param initial_guesses: Initial guesses, :class:`numpy.ndarray` of shape :code:`(nstarts, n_parameters)`.
+        :return: List of :class:`scipy.optimize.OptimizeResult`, one per initial guess.
+        """
+        initial_guesses = np.atleast_2d(np.asarray(initial_guesses, dtype=float))
+        n_starts, n_dim = initial_guesses.shape
+
+        # Initial simplices, constructed as in scipy.optimize.minimize(method='nelder-mead')
+        simplices = np.repeat(initial_guesses[:, np.newaxis, :], n_dim + 1, axis=1)
+        for k in range(n_dim):
+            column = simplices[:, k + 1, k]
+            simplices[:, k + 1, k] = np.where(column != 0, 1.05 * column, 0.00025)
+        simplices = self._clip(simplices)
+        values = function(simplices.reshape((-1, n_dim))).reshape((n_starts, n_dim + 1))
+
+        active = np.ones(n_starts, dtype=bool)
+        n_iterations = np.zeros(n_starts, dtype=int)
+        while np.any(active):
+            order = np.argsort(values, axis=1)
+            simplices = np.take_along_axis(simplices, order[:, :, np.newaxis], axis=1)
+            values = np.take_along_axis(values, order, axis=1)
+
+            converged = ((np.max(np.abs(simplices[:, 1:] - simplices[:, :1]), axis=(1, 2)) <= self.x_tolerance)
+                         & (np.max(np.abs(values[:, 1:] - values[:, :1]), axis=1) <= self.f_tolerance))
+            active &= ~converged & (n_iterations < self.max_iterations)
+            starts = np.flatnonzero(active)
+            if starts.size == 0:
+                break
+            n_iterations[starts] += 1
+
+            best, second_worst, worst = values[starts, 0], values[starts, -2], values[starts, -1]
+            centroid = simplices[starts, :-1].mean(axis=1)
+            worst_point = simplices[starts, -1]
+
+            # Reflection
+            reflected = self._clip(2. * centroid - worst_point)
+            f_reflected = function(reflected)
+
+            # Expansion or contraction, a single extra point per start
+            expand = f_reflected < best
+            accept_reflected = (best <= f_reflected) & (f_reflected < second_worst)
+            contract_outside = (second_worst <= f_reflected) & (f_reflected < worst)
+            candidate = np.where(expand[:, np.newaxis], 3. * centroid - 2. * worst_point,
+                                 np.where(contract_outside[:, np.newaxis], 1.5 * centroid - 0.5 * worst_point,
+                                          0.5 * centroid + 0.5 * worst_point))
+            candidate = self._clip(candidate)
+            needs_candidate = ~accept_reflected
+            f_candidate = np.full(starts.size, np.inf)
+            if np.any(needs_candidate):
+                f_candidate[needs_candidate] = function(candidate[needs_candidate])
+
+            use_reflected = accept_reflected | (expand & (f_reflected <= f_candidate))
+            use_candidate = ((expand & (f_candidate < f_reflected))
+                             | (contract_outside & (f_candidate <= f_reflected))
+                             | (~expand & ~accept_reflected & ~contract_outside & (f_candidate < worst)))
+            shrink = ~use_reflected & ~use_candidate
+
+            simplices[starts[use_reflected], -1] = reflected[use_reflected]
+            values[starts[use_reflected], -1] = f_reflected[use_reflected]
+            simplices[starts[use_candidate], -1] = candidate[use_candidate]
+            values[starts[use_candidate], -1] = f_candidate[use_candidate]
+
+            # Shrink towards the best vertex, all shrunk simplices are evaluated at once
+            if np.any(shrink):
+                shrunk = starts[shrink]
+                simplices[shrunk, 1:] = self._clip(
+                    simplices[shrunk, :1] + 0.5 * (simplices[shrunk, 1:] - simplices[shrunk, :1]))
+                values[shrunk, 1:] = function(simplices[shrunk, 1:].reshape((-1, n_dim))).reshape((-1, n_dim))
+
+        best = np.argmin(values, axis=1)
+        return [OptimizeResult(x=simplices[i, best[i]].copy(), fun=values[i, best[i]], nit=n_iterations[i],
+                               success=n_iterations[i] < self.max_iterations)
+                for i in range(n_starts)]
+
+    def _clip(self, points):
+        if self._bounds is None:
+            return points
+        bounds = np.array(self._bounds, dtype=float)
+        return np.clip(points, bounds[:, 0], bounds[:, 1])
+
+    def apply_constraints(self, constraints):
+        self.logger.warning("The selected optimizer method does not support constraints and thus will be ignored.")
+
+    def update_bounds(self, bounds):
+        self._bounds = bounds
+
+    def supports_jacobian(self):
+        return False
@@ -2,6 +2,7 @@
 
 from UQpy.distributions import *
 import numpy as np
+import pytest
 
 
 def test_beta():
@@ -231,3 +232,128 @@ def test_joint_copula_4():
 def test_joint_copula_5():
     x = np.array([0.5, 0.5]).reshape((1, 2))
     assert np.round(dist_joint_copula.cdf(x=x), 3) == 0.032
+
+
+def test_joint_copula_same_family():
+    marginals_ = [Normal(loc=2., scale=2.), Normal(loc=1., scale=0.5)]
+    dist_joint_ = JointCopula(marginals=marginals_, copula=Gumbel(theta=2.))
+    x = np.array([[0.5, 0.5], [1.5, 0.8]])
+    unif = np.array([m.cdf(x[:, i]) for i, m in enumerate(marginals_)]).T
+    pdf_marginals = marginals_[0].pdf(x[:, 0]) * marginals_[1].pdf(x[:, 1])
+    assert np.allclose(dist_joint_.cdf(x=x), Gumbel(theta=2.).evaluate_cdf(unit_uniform_samples=unif))
+    assert np.allclose(dist_joint_.pdf(x=x), Gumbel(theta=2.).evaluate_pdf(unit_uniform_samples=unif) * pdf_marginals)
+
+
+def test_joint_copula_cache_parameters_update():
+    marginals_ = [Normal(loc=2., scale=2.), Normal(loc=1., scale=0.5)]
+    dist_joint_ = JointCopula(marginals=marginals_, copula=Gumbel(theta=2.))
+    x = np.array([[0.5, 0.5], [1.5, 0.8]])
+    log_pdf_1 = dist_joint_.log_pdf(x=x)
+    assert np.all(dist_joint_.log_pdf(x=x) == log_pdf_1)
+    dist_joint_.update_parameters(loc_0=1.)
+    assert not np.any(dist_joint_.log_pdf(x=x) == log_pdf_1)
+    dist_joint_._cache = False
+    assert np.allclose(dist_joint_.log_pdf(x=x), JointCopula(
+        marginals=[Normal(loc=1., scale=2.), Normal(loc=1., scale=0.5)], copula=Gumbel(theta=2.)).log_pdf(x=x))
+
+
+def test_joint_copula_repeated_x():
+    x = np.array([[0.5, 0.5], [1.5, 0.8]])
+    log_pdf_1 = dist_joint_copula.log_pdf(x=x)
+    x[1, 0] = 0.5
+    assert np.allclose(dist_joint_copula.log_pdf(x=x), [log_pdf_1[0], dist_joint_copula.log_pdf(x=[[0.5, 0.8]])[0]])
+    with pytest.raises(ValueError):
+        dist_joint_copula.log_pdf(x=x.reshape((-1,)))
+
+
+def test_joint_copula_cache_copula_parameters_update():
+    marginals_ = [Normal(loc=2., scale=2.), Normal(loc=1., scale=0.5)]
+    dist_joint_ = JointCopula(marginals=marginals_, copula=Gumbel(theta=2.))
+    x = np.array([[0.5, 0.5], [1.5, 0.8]])
+    pdf_1 = dist_joint_.pdf(x=x)
+    assert np.all(dist_joint_.pdf(x=x) == pdf_1)
+    dist_joint_.update_parameters(theta_c=3.)
+    assert np.allclose(dist_joint_.pdf(x=x), JointCopula(marginals=marginals_, copula=Gumbel(theta=3.)).pdf(x=x))
+
+
+def test_gumbel_log_pdf():
+    assert np.round(Gumbel(theta=2.).evaluate_log_pdf(unit_uniform_samples=unif), 3) == -1.342
+
+
+def test_normal_log_pdf_and_cdf():
+    x = np.array([-1., 0.5, 3.])
+    log_pdf, cdf = Normal(loc=1., scale=2.).log_pdf_and_cdf(x)
+    assert np.allclose(log_pdf, Normal(loc=1., scale=2.).log_pdf(x))
+    assert np.allclose(cdf, Normal(loc=1., scale=2.).cdf(x))
+
+
+def test_joint_copula_same_family_marginal_update():
+    dist_joint_ = JointCopula(marginals=[Normal(loc=2., scale=2.), Normal(loc=1., scale=0.5)], copula=Gumbel(theta=2.))
+    x = np.array([[0.5, 0.5], [1.5, 0.8]])
+    dist_joint_.log_pdf(x=x)
+    dist_joint_.marginals[0].update_parameters(loc=1.)
+    assert np.allclose(dist_joint_.log_pdf(x=x), JointCopula(
+        marginals=[Normal(loc=1., scale=2.), Normal(loc=1., scale=0.5)], copula=Gumbel(theta=2.)).log_pdf(x=x))
+
+
+def test_joint_copula_array_copula_parameters():
+    class ArrayCopula(Copula):
+        def __init__(self, weights):
+            super().__init__(weights=weights)
+
+        def evaluate_cdf(self, unit_uniform_samples):
+            return np.prod(unit_uniform_samples ** self.parameters["weights"], axis=1)
+
+    dist_joint_ = JointCopula(marginals=[Normal(), Normal()], copula=ArrayCopula(weights=np.array([1., 1.])))
+    x = np.array([[0.5, 0.5], [1.5, 0.8]])
+    cdf_1 = dist_joint_.cdf(x=x)
+    assert np.all(dist_joint_.cdf(x=x) == cdf_1)
+    dist_joint_.update_parameters(weights_c=np.array([1., 2.]))
+    assert np.allclose(dist_joint_.cdf(x=x), Normal().cdf(x[:, 0]) * Normal().cdf(x[:, 1]) ** 2)
+
+
+def test_joint_copula_same_family_public_log_pdf_and_cdf():
+    class Logistic2(Logistic):
+        def log_pdf_and_cdf(self, x):
+            return self.log_pdf(x), self.cdf(x)
+
+    marginals_ = [Logistic2(loc=2., scale=2.), Logistic2(loc=1., scale=0.5)]
+    x = np.array([[0.5, 0.5], [1.5, 0.8]])
+    log_pdf = JointCopula(marginals=marginals_, copula=Gumbel(theta=2.)).log_pdf(x=x)
+    marginals_ = [Logistic(loc=2., scale=2.), Logistic(loc=1., scale=0.5)]
+    assert np.allclose(log_pdf, JointCopula(marginals=marginals_, copula=Gumbel(theta=2.)).log_pdf(x=x))
+
+
+def test_gumbel_log_pdf_independence_tail():
+    dist_joint_ = JointCopula(marginals=[Normal(), Normal()], copula=Gumbel(theta=1.))
+    log_pdf = dist_joint_.log_pdf(x=np.array([[0.3, 9.0]]))
+    assert np.round(log_pdf, 2) == -42.38
+    assert np.allclose(log_pdf, Normal().log_pdf(0.3) + Normal().log_pdf(9.0))
+
+
+def test_joint_copula_same_family_copy():
+    import copy
+    dist_joint_ = JointCopula(marginals=[Normal(loc=2., scale=2.), Normal(loc=1., scale=0.5)], copula=Gumbel(theta=2.))
+    x = np.array([[0.5, 0.5], [1.5, 0.8]])
+    log_pdf = dist_joint_.log_pdf(x=x)
+    assert np.allclose(copy.deepcopy(dist_joint_).log_pdf(x=x), log_pdf)
+    dist_copy_ = copy.deepcopy(dist_joint_)
+    dist_copy_.update_parameters(loc_0=1.)
+    dist_joint_.update_parameters(loc_0=1.)
+    assert np.allclose(dist_copy_.log_pdf(x=x), dist_joint_.log_pdf(x=x))
+    assert not np.allclose(dist_copy_.log_pdf(x=x), log_pdf)
+
+
+def test_joint_copula_same_family_unset_parameter():
+    dist_joint_ = JointCopula(marginals=[Normal(loc=None), Normal()], copula=Gumbel(theta=2.))
+    with pytest.raises(TypeError):
+        dist_joint_.log_pdf(x=np.array([[0.5, 0.5]]))
+
+
+def test_joint_copula_copy_user_defined_method():
+    import copy
+    dist_joint_ = JointCopula(marginals=[Normal(), Normal()], copula=Gumbel(theta=2.))
+    dist_joint_.log_pdf = lambda x: np.zeros(len(x))
+    dist_copy_ = copy.deepcopy(dist_joint_)
+    assert np.all(dist_copy_.log_pdf(np.array([[0.5, 0.5]])) == 0.)
+    assert np.allclose(dist_copy_.cdf(np.array([[0.5, 0.5]])), dist_joint_.cdf(np.array([[0.5, 0.5]])))
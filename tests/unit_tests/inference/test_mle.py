@@ -46,3 +46,135 @@ def test_regression_model():
     assert ml_estimator.mle[0] == 0.8689097631871134
     assert ml_estimator.mle[1] == 2.0030767805841143
 
+
+
+def test_batch_nelder_mead():
+    from UQpy.inference.inference_models.LogLikelihoodModel import LogLikelihoodModel
+    from UQpy.utilities.BatchNelderMeadOptimizer import BatchNelderMeadOptimizer
+    np.random.seed(1)
+    data_1 = np.random.normal(1., 0.5, 1000)
+
+    def log_likelihood(data, params):
+        return np.sum(-0.5 * ((data[np.newaxis, :] - params[:, :1]) / params[:, 1:]) ** 2
+                      - np.log(params[:, 1:]), axis=1)
+
+    candidate_model = LogLikelihoodModel(n_parameters=2, log_likelihood=log_likelihood)
+    optimizer = BatchNelderMeadOptimizer(bounds=[[-5., 5.], [0.01, 5.]])
+    ml_estimator = MLE(inference_model=candidate_model, data=data_1, n_optimizations=5, random_state=1,
+                       optimizer=optimizer)
+
+    assert np.allclose(ml_estimator.mle, [np.mean(data_1), np.std(data_1)], atol=1e-3)
+
+
+def test_scalar_log_likelihood():
+    from UQpy.inference.inference_models.LogLikelihoodModel import LogLikelihoodModel
+    np.random.seed(1)
+    data_1 = np.random.normal(1., 0.5, 1000)
+
+    n_calls = {"vectorized": 0, "scalar": 0}
+
+    def gaussian_scalar_log_likelihood(params, data):
+        return np.sum(-0.5 * ((data - params[0]) / params[1]) ** 2 - np.log(params[1]))
+
+    def log_likelihood(data, params):
+        n_calls["vectorized"] += 1
+        return np.array([gaussian_scalar_log_likelihood(params_, data) for params_ in params])
+
+    def scalar_log_likelihood(params, data):
+        n_calls["scalar"] += 1
+        return gaussian_scalar_log_likelihood(params, data)
+
+    optimizer = MinimizeOptimizer(bounds=[[-5., 5.], [0.01, 5.]])
+    mle_vectorized = MLE(inference_model=LogLikelihoodModel(n_parameters=2, log_likelihood=log_likelihood),
+                         data=data_1, n_optimizations=2, random_state=1, optimizer=optimizer)
+    assert n_calls["vectorized"] > 0 and n_calls["scalar"] == 0
+
+    n_calls["vectorized"] = 0
+    mle_scalar = MLE(inference_model=LogLikelihoodModel(n_parameters=2, log_likelihood=log_likelihood,
+                                                        scalar_log_likelihood=scalar_log_likelihood),
+                     data=data_1, n_optimizations=2, random_state=1, optimizer=optimizer)
+    assert n_calls["scalar"] > 0 and n_calls["vectorized"] == 0
+
+    assert np.allclose(mle_scalar.mle, mle_vectorized.mle)
+
+
+def gaussian_log_likelihood(data, params):
+    return np.sum(-0.5 * ((data[np.newaxis, :] - params[:, :1]) / params[:, 1:]) ** 2 - np.log(params[:, 1:]), axis=1)
+
+
+def test_parallel_starts():
+    from UQpy.inference.inference_models.LogLikelihoodModel import LogLikelihoodModel
+    np.random.seed(1)
+    data_1 = np.random.normal(1., 0.5, 1000)
+    candidate_model = LogLikelihoodModel(n_parameters=2, log_likelihood=gaussian_log_likelihood)
+    optimizer = MinimizeOptimizer(bounds=[[-5., 5.], [0.01, 5.]])
+
+    mle_serial = MLE(inference_model=candidate_model, data=data_1, n_optimizations=3, random_state=1,
+                     optimizer=optimizer)
+    mle_parallel = MLE(inference_model=candidate_model, data=data_1, n_optimizations=3, random_state=1,
+                       optimizer=optimizer, n_jobs=2)
+
+    assert np.all(mle_parallel.mle == mle_serial.mle)
+    assert mle_parallel.max_log_like == mle_serial.max_log_like
+
+
+def test_parallel_starts_distribution_model():
+    from UQpy.distributions.collection import JointCopula
+    from UQpy.distributions.copulas import Gumbel
+    np.random.seed(1)
+    data_1 = np.random.normal(1., 0.5, (200, 2))
+    candidate_model = DistributionModel(n_parameters=2, distributions=JointCopula(
+        marginals=[Normal(loc=None, scale=0.5), Normal(loc=None, scale=0.5)], copula=Gumbel(theta=1.5)))
+    optimizer = MinimizeOptimizer(bounds=[[0., 2.], [0., 2.]])
+
+    mle_serial = MLE(inference_model=candidate_model, data=data_1, n_optimizations=3, random_state=1,
+                     optimizer=optimizer)
+    mle_parallel = MLE(inference_model=candidate_model, data=data_1, n_optimizations=3, random_state=1,
+                       optimizer=optimizer, n_jobs=2)
+
+    assert np.all(np.round(mle_serial.mle, 3) == np.array([1.094, 1.067]))
+    assert np.round(mle_serial.max_log_like, 1) == -322.7
+    assert np.allclose(mle_parallel.mle, mle_serial.mle)
+    assert np.isclose(mle_parallel.max_log_like, mle_serial.max_log_like)
+
+
+def test_log_likelihood_parameters_not_reused():
+    from UQpy.inference.inference_models.LogLikelihoodModel import LogLikelihoodModel
+    np.random.seed(1)
+    data_1 = np.random.normal(1., 0.5, 100)
+    evaluated_parameters = []
+
+    def log_likelihood(data, params):
+        evaluated_parameters.append(params)
+        return gaussian_log_likelihood(data, params)
+
+    MLE(inference_model=LogLikelihoodModel(n_parameters=2, log_likelihood=log_likelihood), data=data_1,
+        n_optimizations=1, random_state=1, optimizer=MinimizeOptimizer(bounds=[[-5., 5.], [0.01, 5.]]))
+
+    assert len(set(id(params) for params in evaluated_parameters)) == len(evaluated_parameters)
+
+
+def test_parallel_starts_independence_copula():
+    from UQpy.distributions.collection import JointCopula
+    from UQpy.distributions.copulas import Gumbel
+    np.random.seed(1)
+    data_1 = np.random.normal(1., 0.5, (200, 2))
+    candidate_model = DistributionModel(n_parameters=2, distributions=JointCopula(
+        marginals=[Normal(loc=None, scale=0.5), Normal(loc=None, scale=0.5)], copula=Gumbel(theta=1.)))
+
+    mle_parallel = MLE(inference_model=candidate_model, data=data_1, n_optimizations=3, random_state=1,
+                       optimizer=MinimizeOptimizer(bounds=[[-5., 5.], [-5., 5.]]), n_jobs=2)
+
+    # With the independence copula, the MLE of the locations are the sample means
+    assert np.allclose(mle_parallel.mle, np.mean(data_1, axis=0), atol=1e-4)
+
+
+def test_distribution_fit_nan_candidate():
+    np.random.seed(1)
+    data_1 = np.random.normal(0., 0.1, 1000).reshape((-1, 1))
+    candidate_model = DistributionModel(distributions=Normal(loc=None, scale=None), n_parameters=2)
+    candidate_model.evaluate_log_likelihood = lambda parameters, data: np.array([np.nan, -1., -2.])
+
+    ml_estimator = MLE(inference_model=candidate_model, data=data_1, n_optimizations=3, random_state=1)
+
+    assert ml_estimator.max_log_like == -1.
@@ -78,3 +78,36 @@ def test_samples5():
     'maximin' and metric is callable."""
     expected_samples = np.array([[0.56, 0.2 ], [0.25, 0.62], [1.  , 0.4 ], [0.72, 0.91], [0.06, 0.15]])
     assert (x1h._samples.round(2) == expected_samples).all()
+
+
+def test_samples_same_family_marginals():
+    """ Check that marginals of the same family mapped at once match the per-marginal icdf."""
+    from UQpy.distributions.collection.Normal import Normal
+    marginals = [Normal(loc=0., scale=1.), Normal(loc=2., scale=3.), Normal(loc=-1., scale=0.5)]
+    lhs = LatinHypercubeSampling(distributions=JointIndependent(marginals=marginals), nsamples=5, random_state=1)
+    expected_samples = np.array([m.icdf(lhs.samplesU01[:, j]) for j, m in enumerate(marginals)]).T
+    np.testing.assert_allclose(expected_samples, lhs.samples, rtol=1e-12)
+
+
+def test_samples_mixed_family_marginals():
+    """ Check that marginals grouped by family match the per-marginal icdf."""
+    from UQpy.distributions.collection.Normal import Normal
+    marginals = [Normal(loc=0., scale=1.), Uniform(loc=2., scale=3.), Normal(loc=-1., scale=0.5)]
+    lhs = LatinHypercubeSampling(distributions=marginals, nsamples=5, random_state=1)
+    expected_samples = np.array([m.icdf(lhs.samplesU01[:, j]) for j, m in enumerate(marginals)]).T
+    np.testing.assert_allclose(expected_samples, lhs.samples, rtol=1e-12)
+
+
+def test_samples_marginals_without_icdf():
+    """ Check that the samples of marginals without icdf are left to zero."""
+    from UQpy.distributions.baseclass import DistributionContinuous1D
+
+    class NoIcdf(DistributionContinuous1D):
+        def pdf(self, x):
+            return np.ones_like(x)
+
+    lhs = LatinHypercubeSampling(distributions=[Uniform(loc=2., scale=3.), NoIcdf()], nsamples=5, random_state=1)
+    assert np.all(lhs.samples[:, 1] == 0.)
+    lhs = LatinHypercubeSampling(distributions=JointIndependent(marginals=[Uniform(), NoIcdf()]), nsamples=5,
+                                 random_state=1)
+    assert np.all(lhs.samples == 0.)